@@ -25,8 +25,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
-from functools import lru_cache
-from typing import Union
+from typing import Iterator, Optional, Union
 from bip_utils.bip.bip32 import Bip32Base, Bip32Utils
 from bip_utils.bip.bip44_base.bip44_base_ex import Bip44DepthError
 from bip_utils.bip.bip44_base.bip44_keys import Bip44PublicKey, Bip44PrivateKey
@@ -54,6 +53,15 @@ class Bip44Levels(IntEnum):
     ADDRESS_INDEX = 5
 
 
+# Levels as plain integers, for internal comparisons
+_LEVEL_MASTER: int = int(Bip44Levels.MASTER)
+_LEVEL_PURPOSE: int = int(Bip44Levels.PURPOSE)
+_LEVEL_COIN: int = int(Bip44Levels.COIN)
+_LEVEL_ACCOUNT: int = int(Bip44Levels.ACCOUNT)
+_LEVEL_CHANGE: int = int(Bip44Levels.CHANGE)
+_LEVEL_ADDRESS_INDEX: int = int(Bip44Levels.ADDRESS_INDEX)
+
+
 class Bip44Base(ABC):
     """
     BIP44 base class.
@@ -63,6 +71,12 @@ class Bip44Base(ABC):
 
     m_bip32: Bip32Base
     m_coin_conf: BipCoinConf
+    m_pub_key: Optional[Bip44PublicKey]
+    m_priv_key: Optional[Bip44PrivateKey]
+
+    # Many objects are created when deriving keys, so avoid a dictionary for each of them
+    # (weak references are kept supported)
+    __slots__ = ("m_bip32", "m_coin_conf", "m_pub_key", "m_priv_key", "__weakref__")
 
     #
     # Class methods for construction
@@ -139,6 +153,28 @@ class Bip44Base(ABC):
                                             key_net_ver=coin_conf.KeyNetVersions()),
                    coin_conf)
 
+    @classmethod
+    def _FromBip32Unchecked(cls,
+                            bip32_obj: Bip32Base,
+                            coin_conf: BipCoinConf) -> Bip44Base:
+        """
+        Create a Bip object from the specified Bip32 object without validating its depth.
+        It shall be used only for Bip32 objects derived from a valid Bip object (i.e. by the derivation methods).
+
+        Args:
+            bip32_obj (Bip32 object): Bip32 object
+            coin_conf (BipCoinConf) : BipCoinConf object
+
+        Returns:
+            Bip object: Bip object
+        """
+        bip_obj = cls.__new__(cls)
+        bip_obj.m_bip32 = bip32_obj
+        bip_obj.m_coin_conf = coin_conf
+        bip_obj.m_pub_key = None
+        bip_obj.m_priv_key = None
+        return bip_obj
+
     #
     # Public methods
     #
@@ -156,12 +192,12 @@ class Bip44Base(ABC):
         Returns:
             Bip44DepthError: If the Bip32 object depth is not valid
         """
-        depth = bip32_obj.Depth()
+        depth = bip32_obj.Depth().ToInt()
 
         # If the Bip32 is public-only, the depth shall start from the account level because hardened derivation is
         # used below it, which is not possible with public keys
         if bip32_obj.IsPublicOnly():
-            if depth < Bip44Levels.ACCOUNT or depth > Bip44Levels.ADDRESS_INDEX:
+            if depth < _LEVEL_ACCOUNT or depth > _LEVEL_ADDRESS_INDEX:
                 raise Bip44DepthError(
                     f"Depth of the public-only Bip32 object ({depth}) is below account level or "
                     f"beyond address index level"
@@ -169,7 +205,7 @@ class Bip44Base(ABC):
         # If the Bip32 object is not public-only, any depth is fine as long as it is not greater
         # than address index level
         else:
-            if depth < 0 or depth > Bip44Levels.ADDRESS_INDEX:
+            if depth < 0 or depth > _LEVEL_ADDRESS_INDEX:
                 raise Bip44DepthError(
                     f"Depth of the Bip32 object ({depth}) is invalid or beyond address index level"
                 )
@@ -177,8 +213,9 @@ class Bip44Base(ABC):
         # Finally, initialize class
         self.m_bip32 = bip32_obj
         self.m_coin_conf = coin_conf
+        self.m_pub_key = None
+        self.m_priv_key = None
 
-    @lru_cache()
     def PublicKey(self) -> Bip44PublicKey:
         """
         Return the public key.
@@ -189,10 +226,12 @@ class Bip44Base(ABC):
         Raises:
             Bip32KeyError: If the key constructed from the bytes is not valid
         """
-        return Bip44PublicKey(self.m_bip32.PublicKey(),
-                              self.m_coin_conf)
+        # Computed only the first time it is requested
+        if self.m_pub_key is None:
+            self.m_pub_key = Bip44PublicKey(self.m_bip32.PublicKey(),
+                                            self.m_coin_conf)
+        return self.m_pub_key
 
-    @lru_cache()
     def PrivateKey(self) -> Bip44PrivateKey:
         """
         Return the private key.
@@ -203,8 +242,27 @@ class Bip44Base(ABC):
         Raises:
             Bip32KeyError: If the Bip32 object is public-only or the constructed key is not valid
         """
-        return Bip44PrivateKey(self.m_bip32.PrivateKey(),
-                               self.m_coin_conf)
+        # Computed only the first time it is requested
+        if self.m_priv_key is None:
+            self.m_priv_key = Bip44PrivateKey(self.m_bip32.PrivateKey(),
+                                              self.m_coin_conf)
+        return self.m_priv_key
+
+    def Address(self) -> str:
+        """
+        Return the address correspondent to the public key.
+        It's the same of PublicKey().ToAddress(), but it doesn't construct the Bip44PublicKey object if not needed.
+
+        Returns:
+            str: Address string
+
+        Raises:
+            ValueError: If the coin is Monero (use the Monero class instead)
+        """
+        if self.m_pub_key is not None:
+            return self.m_pub_key.ToAddress()
+        return Bip44PublicKey.ComputeAddress(self.m_bip32.PublicKey(),
+                                             self.m_coin_conf)
 
     def CoinConf(self) -> BipCoinConf:
         """
@@ -243,6 +301,143 @@ class Bip44Base(ABC):
 
         return self.m_bip32.Depth() == level
 
+    def Coin(self) -> Bip44Base:
+        """
+        Derive a child key from the coin type specified at construction and return a new Bip object.
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        depth = self.m_bip32.Depth()
+        if depth != _LEVEL_PURPOSE:
+            raise Bip44DepthError(
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving coin"
+            )
+
+        coin_conf = self.m_coin_conf
+        return self._FromBip32Unchecked(self.m_bip32.ChildKey(coin_conf.CoinIndexHardened()),
+                                        coin_conf)
+
+    def Account(self,
+                acc_idx: int) -> Bip44Base:
+        """
+        Derive a child key from the specified account index and return a new Bip object.
+
+        Args:
+            acc_idx (int): Account index
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        depth = self.m_bip32.Depth()
+        if depth != _LEVEL_COIN:
+            raise Bip44DepthError(
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving account"
+            )
+
+        return self._FromBip32Unchecked(self.m_bip32.ChildKey(Bip32Utils.HardenIndex(acc_idx)),
+                                        self.m_coin_conf)
+
+    def Change(self,
+               change_type: Bip44Changes) -> Bip44Base:
+        """
+        Derive a child key from the specified change type and return a new Bip object.
+
+        Args:
+            change_type (Bip44Changes): Change type, must a Bip44Changes enum
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            TypeError: If chain index is not a Bip44Changes enum
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        if not isinstance(change_type, Bip44Changes):
+            raise TypeError("Change index is not an enumerative of Bip44Changes")
+
+        depth = self.m_bip32.Depth()
+        if depth != _LEVEL_ACCOUNT:
+            raise Bip44DepthError(
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving change"
+            )
+
+        bip32_obj = self.m_bip32
+
+        # Use hardened derivation if not-hardended is not supported
+        if not bip32_obj.IsPrivateUnhardenedDerivationSupported():
+            change_idx = Bip32Utils.HardenIndex(int(change_type))
+        else:
+            change_idx = int(change_type)
+
+        return self._FromBip32Unchecked(bip32_obj.ChildKey(change_idx),
+                                        self.m_coin_conf)
+
+    def AddressIndex(self,
+                     addr_idx: int) -> Bip44Base:
+        """
+        Derive a child key from the specified address index and return a new Bip object.
+
+        Args:
+            addr_idx (int): Address index
+
+        Returns:
+            Bip44Base object: Bip44Base object
+
+        Raises:
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        depth = self.m_bip32.Depth()
+        if depth != _LEVEL_CHANGE:
+            raise Bip44DepthError(
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving address"
+            )
+
+        bip32_obj = self.m_bip32
+
+        # Use hardened derivation if not-hardended is not supported
+        if not bip32_obj.IsPrivateUnhardenedDerivationSupported():
+            addr_idx = Bip32Utils.HardenIndex(addr_idx)
+
+        return self._FromBip32Unchecked(bip32_obj.ChildKey(addr_idx),
+                                        self.m_coin_conf)
+
+    def AddressIndexRange(self,
+                          start_idx: int,
+                          stop_idx: int) -> Iterator[Bip44Base]:
+        """
+        Derive the child keys of all the address indexes in the specified range and return the new Bip objects.
+        It's equivalent to calling AddressIndex for each index, but the depth is checked only once.
+
+        Args:
+            start_idx (int): Start address index (included)
+            stop_idx (int) : Stop address index (excluded)
+
+        Returns:
+            Iterator[Bip44Base object]: Iterator over Bip44Base objects
+
+        Raises:
+            Bip44DepthError: If current depth is not suitable for deriving keys
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        depth = self.m_bip32.Depth()
+        if depth != _LEVEL_CHANGE:
+            raise Bip44DepthError(
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving address"
+            )
+
+        return self.__AddressIndexRangeIter(start_idx, stop_idx)
+
     #
     # Protected class methods
     #
@@ -266,18 +461,17 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not cls.IsLevel(bip_obj, Bip44Levels.MASTER):
+        depth = bip_obj.m_bip32.Depth()
+        if depth != _LEVEL_MASTER:
             raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving default path"
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving default path"
             )
 
-        # Derive purpose and coin by default
-        bip_obj = cls._PurposeGeneric(bip_obj, purpose)
-        bip_obj = cls._CoinGeneric(bip_obj)
-
-        # Derive the remaining path
-        return cls(bip_obj.m_bip32.DerivePath(bip_obj.m_coin_conf.DefaultPath()),
-                   bip_obj.m_coin_conf)
+        # Derive purpose, coin and the remaining path directly on the Bip32 object
+        coin_conf = bip_obj.m_coin_conf
+        bip32_obj = bip_obj.m_bip32.ChildKey(purpose).ChildKey(coin_conf.CoinIndexHardened())
+        return cls._FromBip32Unchecked(bip32_obj.DerivePath(coin_conf.DefaultPathObject()),
+                                       coin_conf)
 
     @classmethod
     def _PurposeGeneric(cls,
@@ -298,20 +492,21 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not cls.IsLevel(bip_obj, Bip44Levels.MASTER):
+        depth = bip_obj.m_bip32.Depth()
+        if depth != _LEVEL_MASTER:
             raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving purpose"
+                f"Current depth ({depth.ToInt()}) is not suitable for deriving purpose"
             )
 
-        return cls(bip_obj.m_bip32.ChildKey(purpose),
-                   bip_obj.m_coin_conf)
+        return cls._FromBip32Unchecked(bip_obj.m_bip32.ChildKey(purpose),
+                                       bip_obj.m_coin_conf)
 
     @classmethod
     def _CoinGeneric(cls,
                      bip_obj: Bip44Base) -> Bip44Base:
         """
         Derive a child key from the coin type specified at construction and return a new Bip object.
-        It shall be called from a child class.
+        Kept for compatibility, it calls Bip44Base.Coin directly (safe to be used when overriding Coin).
 
         Args:
             bip_obj (Bip44Base object): Bip44Base object
@@ -323,15 +518,7 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not cls.IsLevel(bip_obj, Bip44Levels.PURPOSE):
-            raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving coin"
-            )
-
-        coin_idx = bip_obj.m_coin_conf.CoinIndex()
-
-        return cls(bip_obj.m_bip32.ChildKey(Bip32Utils.HardenIndex(coin_idx)),
-                   bip_obj.m_coin_conf)
+        return Bip44Base.Coin(bip_obj)
 
     @classmethod
     def _AccountGeneric(cls,
@@ -339,7 +526,7 @@ class Bip44Base(ABC):
                         acc_idx: int) -> Bip44Base:
         """
         Derive a child key from the specified account index and return a new Bip object.
-        It shall be called from a child class.
+        Kept for compatibility, it calls Bip44Base.Account directly (safe to be used when overriding Account).
 
         Args:
             bip_obj (Bip44Base object): Bip44Base object
@@ -352,13 +539,7 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not cls.IsLevel(bip_obj, Bip44Levels.COIN):
-            raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving account"
-            )
-
-        return cls(bip_obj.m_bip32.ChildKey(Bip32Utils.HardenIndex(acc_idx)),
-                   bip_obj.m_coin_conf)
+        return Bip44Base.Account(bip_obj, acc_idx)
 
     @classmethod
     def _ChangeGeneric(cls,
@@ -366,7 +547,7 @@ class Bip44Base(ABC):
                        change_type: Bip44Changes) -> Bip44Base:
         """
         Derive a child key from the specified chain type and return a new Bip object.
-        It shall be called from a child class.
+        Kept for compatibility, it calls Bip44Base.Change directly (safe to be used when overriding Change).
 
         Args:
             bip_obj (Bip44Base object): Bip44Base object
@@ -380,22 +561,7 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not isinstance(change_type, Bip44Changes):
-            raise TypeError("Change index is not an enumerative of Bip44Changes")
-
-        if not cls.IsLevel(bip_obj, Bip44Levels.ACCOUNT):
-            raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving change"
-            )
-
-        # Use hardened derivation if not-hardended is not supported
-        if not bip_obj.m_bip32.IsPrivateUnhardenedDerivationSupported():
-            change_idx = Bip32Utils.HardenIndex(int(change_type))
-        else:
-            change_idx = int(change_type)
-
-        return cls(bip_obj.m_bip32.ChildKey(change_idx),
-                   bip_obj.m_coin_conf)
+        return Bip44Base.Change(bip_obj, change_type)
 
     @classmethod
     def _AddressIndexGeneric(cls,
@@ -403,7 +569,7 @@ class Bip44Base(ABC):
                              addr_idx: int) -> Bip44Base:
         """
         Derive a child key from the specified address index and return a new Bip object.
-        It shall be called from a child class.
+        Kept for compatibility, it calls Bip44Base.AddressIndex directly (safe to be used when overriding AddressIndex).
 
         Args:
             bip_obj (Bip44Base object): Bip44Base object
@@ -416,17 +582,38 @@ class Bip44Base(ABC):
             Bip44DepthError: If the current depth is not suitable for deriving keys
             Bip32KeyError: If the derivation results in an invalid key
         """
-        if not cls.IsLevel(bip_obj, Bip44Levels.CHANGE):
-            raise Bip44DepthError(
-                f"Current depth ({bip_obj.m_bip32.Depth().ToInt()}) is not suitable for deriving address"
-            )
+        return Bip44Base.AddressIndex(bip_obj, addr_idx)
+
+    #
+    # Private methods
+    #
+
+    def __AddressIndexRangeIter(self,
+                                start_idx: int,
+                                stop_idx: int) -> Iterator[Bip44Base]:
+        """
+        Iterate over the child keys of all the address indexes in the specified range.
+
+        Args:
+            start_idx (int): Start address index (included)
+            stop_idx (int) : Stop address index (excluded)
+
+        Returns:
+            Iterator[Bip44Base object]: Iterator over Bip44Base objects
 
+        Raises:
+            Bip32KeyError: If the derivation results in an invalid key
+        """
+        bip32_obj = self.m_bip32
+        coin_conf = self.m_coin_conf
         # Use hardened derivation if not-hardended is not supported
-        if not bip_obj.m_bip32.IsPrivateUnhardenedDerivationSupported():
-            addr_idx = Bip32Utils.HardenIndex(addr_idx)
+        harden_idx = not bip32_obj.IsPrivateUnhardenedDerivationSupported()
 
-        return cls(bip_obj.m_bip32.ChildKey(addr_idx),
-                   bip_obj.m_coin_conf)
+        for addr_idx in range(start_idx, stop_idx):
+            if harden_idx:
+                addr_idx = Bip32Utils.HardenIndex(addr_idx)
+            yield self._FromBip32Unchecked(bip32_obj.ChildKey(addr_idx),
+                                           coin_conf)
 
     #
     # Abstract methods
@@ -525,75 +712,6 @@ class Bip44Base(ABC):
             Bip32KeyError: If the derivation results in an invalid key
         """
 
-    @abstractmethod
-    def Coin(self) -> Bip44Base:
-        """
-        Derive a child key from the coin type specified at construction and return a new Bip object.
-        It calls the underlying _CoinGeneric method with the current object as parameter.
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-
-    @abstractmethod
-    def Account(self,
-                acc_idx: int) -> Bip44Base:
-        """
-        Derive a child key from the specified account index and return a new Bip object.
-        It calls the underlying _AccountGeneric method with the current object as parameter.
-
-        Args:
-            acc_idx (int): Account index
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-
-    @abstractmethod
-    def Change(self,
-               change_type: Bip44Changes) -> Bip44Base:
-        """
-        Derive a child key from the specified change type and return a new Bip object.
-        It calls the underlying _ChangeGeneric method with the current object as parameter.
-
-        Args:
-            change_type (Bip44Changes): Change type, must a Bip44Changes enum
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            TypeError: If chain index is not a Bip44Changes enum
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-
-    @abstractmethod
-    def AddressIndex(self,
-                     addr_idx: int) -> Bip44Base:
-        """
-        Derive a child key from the specified address index and return a new Bip object.
-        It calls the underlying _AddressIndexGeneric method with the current object as parameter.
-
-        Args:
-            addr_idx (int): Address index
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-
     @staticmethod
     @abstractmethod
     def SpecName() -> str:
@@ -101,18 +101,27 @@ class Bip44PublicKey:
         Returns:
             str: Address string
         """
-        return self.__ComputeAddress()
+        return self.ComputeAddress(self.m_pub_key, self.m_coin_conf)
 
-    def __ComputeAddress(self) -> str:
+    @staticmethod
+    def ComputeAddress(pub_key: Bip32PublicKey,
+                       coin_conf: BipCoinConf) -> str:
         """
-        Compute address.
+        Compute the address of the specified public key.
+
+        Args:
+            pub_key (Bip32PublicKey object): Bip32PublicKey object
+            coin_conf (BipCoinConf object) : BipCoinConf object
 
         Returns:
             str: Address string
+
+        Raises:
+            ValueError: If the coin is Monero (use the Monero class instead)
         """
-        addr_params = self.m_coin_conf.AddrParams()
-        addr_cls = self.m_coin_conf.AddrClass()
-        pub_key_obj = self.Bip32Key().KeyObject()
+        addr_params = coin_conf.AddrParams()
+        addr_cls = coin_conf.AddrClass()
+        pub_key_obj = pub_key.KeyObject()
 
         # Exception for Monero
         if addr_cls is XmrAddrEncoder:
@@ -26,7 +26,7 @@ Reference: https://github.com/bitcoin/bips/blob/master/bip-0086.mediawiki
 # Imports
 from typing import Union
 from bip_utils.bip.bip32 import Bip32Utils
-from bip_utils.bip.bip44_base import Bip44Changes, Bip44Base
+from bip_utils.bip.bip44_base import Bip44Base
 from bip_utils.bip.conf.bip86 import Bip86ConfGetter
 from bip_utils.bip.conf.common import BipCoins
 from bip_utils.ecc import IPrivateKey
@@ -47,6 +47,8 @@ class Bip86(Bip44Base):
     It allows master key generation and children keys derivation in according to BIP-0086.
     """
 
+    __slots__ = ()
+
     #
     # Class methods for construction
     #
@@ -157,75 +159,6 @@ class Bip86(Bip44Base):
         """
         return self._PurposeGeneric(self, Bip86Const.PURPOSE)
 
-    def Coin(self) -> Bip44Base:
-        """
-        Derive a child key from the coin type specified at construction and return a new Bip object.
-        It calls the underlying _CoinGeneric method with the current object as parameter.
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-        return self._CoinGeneric(self)
-
-    def Account(self,
-                acc_idx: int) -> Bip44Base:
-        """
-        Derive a child key from the specified account index and return a new Bip object.
-        It calls the underlying _AccountGeneric method with the current object as parameter.
-
-        Args:
-            acc_idx (int): Account index
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-        return self._AccountGeneric(self, acc_idx)
-
-    def Change(self,
-               change_type: Bip44Changes) -> Bip44Base:
-        """
-        Derive a child key from the specified change type and return a new Bip object.
-        It calls the underlying _ChangeGeneric method with the current object as parameter.
-
-        Args:
-            change_type (Bip44Changes): Change type, must a Bip44Changes enum
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            TypeError: If chain index is not a Bip44Changes enum
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-        return self._ChangeGeneric(self, change_type)
-
-    def AddressIndex(self,
-                     addr_idx: int) -> Bip44Base:
-        """
-        Derive a child key from the specified address index and return a new Bip object.
-        It calls the underlying _AddressIndexGeneric method with the current object as parameter.
-
-        Args:
-            addr_idx (int): Address index
-
-        Returns:
-            Bip44Base object: Bip44Base object
-
-        Raises:
-            Bip44DepthError: If current depth is not suitable for deriving keys
-            Bip32KeyError: If the derivation results in an invalid key
-        """
-        return self._AddressIndexGeneric(self, addr_idx)
-
     @staticmethod
     def SpecName() -> str:
         """
@@ -23,7 +23,7 @@
 # Imports
 from typing import Any, Dict, Optional, Type
 from bip_utils.addr import IAddrEncoder
-from bip_utils.bip.bip32 import Bip32KeyNetVersions, Bip32Base
+from bip_utils.bip.bip32 import Bip32KeyNetVersions, Bip32Base, Bip32Path, Bip32PathParser, Bip32Utils
 from bip_utils.utils.conf import CoinNames as UtilsCoinNames
 
 
@@ -32,8 +32,10 @@ class BipCoinConf:
 
     m_coin_names: UtilsCoinNames
     m_coin_idx: int
+    m_coin_idx_hardened: int
     m_is_testnet: bool
     m_def_path: str
+    m_def_path_obj: Bip32Path
     m_key_net_ver: Bip32KeyNetVersions
     m_wif_net_ver: Optional[bytes]
     m_bip32_cls: Type[Bip32Base]
@@ -66,8 +68,10 @@ class BipCoinConf:
         """
         self.m_coin_names = coin_names
         self.m_coin_idx = coin_idx
+        self.m_coin_idx_hardened = Bip32Utils.HardenIndex(coin_idx)
         self.m_is_testnet = is_testnet
         self.m_def_path = def_path
+        self.m_def_path_obj = Bip32PathParser.Parse(def_path)
         self.m_key_net_ver = key_net_ver
         self.m_wif_net_ver = wif_net_ver
         self.m_bip32_cls = bip32_cls
@@ -92,6 +96,15 @@ class BipCoinConf:
         """
         return self.m_coin_idx
 
+    def CoinIndexHardened(self) -> int:
+        """
+        Get hardened coin index.
+
+        Returns:
+            int: Hardened coin index
+        """
+        return self.m_coin_idx_hardened
+
     def IsTestNet(self) -> bool:
         """
         Get if test net.
@@ -110,6 +123,16 @@ class BipCoinConf:
         """
         return self.m_def_path
 
+    def DefaultPathObject(self) -> Bip32Path:
+        """
+        Get the default derivation path as a Bip32Path object.
+        The path is parsed only once at construction.
+
+        Returns:
+            Bip32Path object: Bip32Path object
+        """
+        return self.m_def_path_obj
+
     def KeyNetVersions(self) -> Bip32KeyNetVersions:
         """
         Get key net versions.
@@ -24,8 +24,8 @@
 from __future__ import annotations
 import re
 from functools import lru_cache
-from typing import Dict, Iterator, List, Optional, Sequence, Union
-from scalecodec.base import RuntimeConfigurationObject, ScaleType
+from typing import Iterator, List, Optional, Sequence, Union
+from scalecodec.base import RuntimeConfigurationObject
 from bip_utils.substrate.substrate_ex import SubstratePathError
 from bip_utils.utils.misc import CryptoUtils
 
@@ -43,16 +43,6 @@ class SubstratePathConst:
     # hard path prefix
     HARD_PATH_PREFIX: str = "//"
 
-    # SCALE encoders for integers
-    SCALE_INT_ENCODERS: Dict[int, ScaleType] = {
-        8: RuntimeConfigurationObject().create_scale_object("U8"),
-        16: RuntimeConfigurationObject().create_scale_object("U16"),
-        32: RuntimeConfigurationObject().create_scale_object("U32"),
-        64: RuntimeConfigurationObject().create_scale_object("U64"),
-        128: RuntimeConfigurationObject().create_scale_object("U128"),
-        256: RuntimeConfigurationObject().create_scale_object("U256"),
-    }
-
 
 class SubstratePathElem:
     """
@@ -138,28 +128,25 @@ class SubstratePathElem:
             SubstratePathError: If path is a number bigger than 256-bit
         """
 
+        max_len = SubstratePathConst.ENCODED_ELEM_MAX_BYTE_LEN
+
         # Integer
         if self.m_elem.isnumeric():
-            bit_len = int(self.m_elem).bit_length()
-
-            # Find scale encoder
-            scale_enc = None
-            for min_bit_len, int_scale_enc in SubstratePathConst.SCALE_INT_ENCODERS.items():
-                if bit_len <= min_bit_len:
-                    scale_enc = int_scale_enc
-
-            if scale_enc is None:
+            int_elem = int(self.m_elem)
+            bit_len = int_elem.bit_length()
+            if bit_len > max_len * 8:
                 raise SubstratePathError(f"Invalid integer bit length ({bit_len})")
+
+            # SCALE encoding of unsigned integers is little endian, so encoding to the maximum length
+            # is the same of encoding with the smallest suitable type and padding with zeros
+            enc_data = int_elem.to_bytes(max_len, "little")
         # String
         else:
             scale_enc = RuntimeConfigurationObject().create_scale_object("Bytes")
-
-        # Encode element
-        scale_enc.encode(self.m_elem)
-        enc_data = bytes(scale_enc.data.data)
+            scale_enc.encode(self.m_elem)
+            enc_data = bytes(scale_enc.data.data)
 
         # Compute chain code
-        max_len = SubstratePathConst.ENCODED_ELEM_MAX_BYTE_LEN
         if len(enc_data) > max_len:
             chain_code = CryptoUtils.Blake2b(enc_data, digest_size=max_len)
         else:
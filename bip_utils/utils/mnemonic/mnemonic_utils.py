@@ -23,16 +23,20 @@
 # Imports
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Type
+from functools import lru_cache
+from typing import Dict, List, Tuple, Type
 from bip_utils.utils.mnemonic.mnemonic import MnemonicLanguages, Mnemonic
 
 
 class MnemonicWordsList:
     """Mnemonic words list class."""
 
-    m_idx_to_words: List[str]
+    m_idx_to_words: Tuple[str, ...]
     m_words_to_idx: Dict[str, int]
 
+    # Words lists are never modified after construction
+    __slots__ = ("m_idx_to_words", "m_words_to_idx")
+
     def __init__(self,
                  words_list: List[str]) -> None:
         """
@@ -41,9 +45,22 @@ class MnemonicWordsList:
         Args:
             words_list (list[str]): Words list
         """
-        self.m_idx_to_words = words_list
+        self.m_idx_to_words = tuple(words_list)
         # Map strings to indexes as well for a quick word searching
-        self.m_words_to_idx = {words_list[i]: i for i in range(len(words_list))}
+        self.m_words_to_idx = dict(zip(self.m_idx_to_words, range(len(self.m_idx_to_words))))
+
+    def Contains(self,
+                 word: str) -> bool:
+        """
+        Get if the specified word is contained in the words list.
+
+        Args:
+            word (str): Word to be searched
+
+        Returns:
+            bool: True if the word is contained, false otherwise
+        """
+        return word in self.m_words_to_idx
 
     def GetWordIdx(self,
                    word: str) -> int:
@@ -103,7 +120,8 @@ class MnemonicWordsListFileReader:
 
         # Read file
         with open(file_path, "r", encoding="utf-8") as fin:
-            words_list = [word.strip() for word in fin.readlines() if word.strip() != ""]
+            # Words contain no spaces, so splitting also strips them and discards empty lines
+            words_list = fin.read().split()
 
         # Check words list count
         if len(words_list) != words_num:
@@ -111,18 +129,32 @@ class MnemonicWordsListFileReader:
 
         return MnemonicWordsList(words_list)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def LoadFileCached(file_path: str,
+                       words_num: int) -> MnemonicWordsList:
+        """
+        Load words list file correspondent to the specified language.
+        The file is loaded only the first time, then the same MnemonicWordsList object is returned.
 
-class MnemonicWordsListGetterBase(ABC):
-    """Mnemonic words list getter base class."""
+        Args:
+            file_path (str): File name
+            words_num (int): Number of expected words
 
-    m_words_lists: Dict[MnemonicLanguages, MnemonicWordsList]
+        Returns:
+            MnemonicWordsList: MnemonicWordsList object
 
-    # Global instance
-    __instance: Optional[MnemonicWordsListGetterBase] = None
+        Raises:
+            ValueError: If loaded words list is not valid
+        """
+        return MnemonicWordsListFileReader.LoadFile(file_path, words_num)
 
-    def __init__(self):
-        """Construct class."""
-        self.m_words_lists = {}
+
+class MnemonicWordsListGetterBase(ABC):
+    """Mnemonic words list getter base class."""
+
+    # Global instances, one for each class
+    __instances: Dict[Type[MnemonicWordsListGetterBase], MnemonicWordsListGetterBase] = {}
 
     @abstractmethod
     def GetByLanguage(self,
@@ -150,7 +182,7 @@ class MnemonicWordsListGetterBase(ABC):
         Load words list.
 
         Args:
-            lang (MnemonicLanguages): Language
+            lang (MnemonicLanguages): Language (not used, words lists are cached by file name)
             file_name (str)         : File name
             words_num (int)         : Number of expected words
 
@@ -162,13 +194,7 @@ class MnemonicWordsListGetterBase(ABC):
         """
 
         # Only load words list for a specific language the first time it is requested
-        try:
-            return self.m_words_lists[lang]
-        except KeyError:
-            self.m_words_lists[lang] = MnemonicWordsListFileReader.LoadFile(file_name,
-                                                                            words_num)
-
-            return self.m_words_lists[lang]
+        return MnemonicWordsListFileReader.LoadFileCached(file_name, words_num)
 
     @classmethod
     def Instance(cls) -> MnemonicWordsListGetterBase:
@@ -178,9 +204,10 @@ class MnemonicWordsListGetterBase(ABC):
         Returns:
             MnemonicWordsListGetterBase object: MnemonicWordsListGetterBase object
         """
-        if cls.__instance is None:
-            cls.__instance = cls()
-        return cls.__instance
+        instances = MnemonicWordsListGetterBase.__instances
+        if cls not in instances:
+            instances[cls] = cls()
+        return instances[cls]
 
 
 class MnemonicWordsListFinderBase(ABC):
@@ -227,17 +254,17 @@ class MnemonicWordsListFinderBase(ABC):
         Raises:
             ValueError: If the mnemonic language cannot be found
         """
+        words = mnemonic.ToList()
+        words_list_getter = words_list_getter_cls.Instance()
+
+        # Words lists are loaded only until the correct language is found
         for lang in langs_enum:
+            words_list = words_list_getter.GetByLanguage(lang)
             # Search all the words because some languages have words in common
             # (e.g. 'fatigue' both in English and French)
             # It's more time consuming, but considering only the first word can detect the wrong language sometimes
-            try:
-                words_list = words_list_getter_cls.Instance().GetByLanguage(lang)
-                for word in mnemonic.ToList():
-                    words_list.GetWordIdx(word)
+            if all(words_list.Contains(word) for word in words):
                 return words_list, lang
-            except ValueError:
-                continue
 
         # Language not found
         raise ValueError(f"Invalid language for mnemonic '{mnemonic.ToStr()}'")
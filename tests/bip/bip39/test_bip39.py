@@ -26,6 +26,7 @@ from bip_utils import (
     MnemonicChecksumError, Bip39WordsNum, Bip39EntropyBitLen, Bip39Languages,
     Bip39EntropyGenerator, Bip39MnemonicGenerator, Bip39MnemonicValidator, Bip39SeedGenerator, Bip39MnemonicDecoder
 )
+from bip_utils.bip.bip39.bip39_mnemonic_utils import Bip39WordsListGetter
 
 # Tests from BIP39 page
 # https://github.com/trezor/python-mnemonic/blob/master/vectors.json
@@ -442,6 +443,29 @@ class Bip39Tests(unittest.TestCase):
         for test_words_num in TEST_VECT_WORDS_NUM_INVALID:
             self.assertRaises(ValueError, Bip39MnemonicGenerator().FromWordsNumber, test_words_num)
 
+    # Test words list search
+    def test_words_list_contains(self):
+        words_list = Bip39WordsListGetter.Instance().GetByLanguage(Bip39Languages.ENGLISH)
+
+        self.assertTrue(words_list.Contains("abandon"))
+        self.assertEqual(0, words_list.GetWordIdx("abandon"))
+        self.assertFalse(words_list.Contains("abandonn"))
+        self.assertRaises(ValueError, words_list.GetWordIdx, "abandonn")
+
+    # Test words list getter global instances
+    def test_words_list_getter_instance(self):
+        class Bip39WordsListGetterChild(Bip39WordsListGetter):
+            pass
+
+        getter = Bip39WordsListGetter.Instance()
+        self.assertIs(getter, Bip39WordsListGetter.Instance())
+
+        # A child class shall get its own instance, even if the parent one was already created
+        getter_child = Bip39WordsListGetterChild.Instance()
+        self.assertIsInstance(getter_child, Bip39WordsListGetterChild)
+        self.assertIsNot(getter, getter_child)
+        self.assertIs(getter_child, Bip39WordsListGetterChild.Instance())
+
     # Tests invalid mnemonic
     def test_invalid_mnemonic(self):
         for test in TEST_VECT_MNEMONIC_INVALID:
@@ -2208,6 +2208,26 @@ class Bip44Tests(unittest.TestCase):
     def test_is_level(self):
         Bip44BaseTestHelper.test_is_level(self, Bip44, Bip44Coins, TEST_SEED)
 
+    # Test address computation
+    def test_address(self):
+        Bip44BaseTestHelper.test_address(self, Bip44, TEST_VECT)
+
+    # Test weak references
+    def test_weak_ref(self):
+        Bip44BaseTestHelper.test_weak_ref(self, Bip44, Bip44Coins, TEST_SEED)
+
+    # Test address index range derivation
+    def test_address_index_range(self):
+        # Stellar and Solana use ed25519, so addresses are derived with hardened indexes
+        Bip44BaseTestHelper.test_address_index_range(self,
+                                                     Bip44,
+                                                     (Bip44Coins.BITCOIN, Bip44Coins.SOLANA, Bip44Coins.STELLAR),
+                                                     TEST_SEED)
+
+    # Test child classes overriding derivation methods
+    def test_generic_derivations_override(self):
+        Bip44BaseTestHelper.test_generic_derivations_override(self, Bip44, Bip44Coins, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         Bip44BaseTestHelper.test_key_formats(self, Bip44, TEST_VECT_KEY_FORMATS)
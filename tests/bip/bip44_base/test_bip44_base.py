@@ -21,6 +21,7 @@
 
 # Imports
 import binascii
+import weakref
 from bip_utils import (
     Bip32KeyError, Bip44Coins, Bip49Coins, Bip44Changes, Bip44Levels, Bip44DepthError,
     Bip44PublicKey, Bip44PrivateKey, Monero
@@ -225,6 +226,84 @@ class Bip44BaseTestHelper:
         # Invalid parameter
         ut_class.assertRaises(TypeError, bip_obj_ctx.IsLevel, 0)
 
+    # Test address index range derivation
+    @staticmethod
+    def test_address_index_range(ut_class, bip_class, test_coins, test_seed_bytes):
+        for coin in test_coins:
+            bip_obj_ctx = bip_class.FromSeed(binascii.unhexlify(test_seed_bytes), coin)
+            bip_obj_ctx = bip_obj_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+
+            bip_obj_addrs = list(bip_obj_ctx.AddressIndexRange(2, 7))
+            ut_class.assertEqual(5, len(bip_obj_addrs))
+            for idx, bip_obj_addr_ctx in enumerate(bip_obj_addrs, 2):
+                ut_class.assertTrue(bip_obj_addr_ctx.IsLevel(Bip44Levels.ADDRESS_INDEX))
+                ut_class.assertEqual(bip_obj_ctx.AddressIndex(idx).PrivateKey().ToExtended(),
+                                     bip_obj_addr_ctx.PrivateKey().ToExtended())
+
+            # Empty range
+            ut_class.assertEqual([], list(bip_obj_ctx.AddressIndexRange(3, 3)))
+            # Invalid depth, raised before iterating
+            ut_class.assertRaises(Bip44DepthError, bip_obj_ctx.AddressIndex(0).AddressIndexRange, 0, 1)
+
+    # Test child classes overriding derivation methods through the generic ones
+    @staticmethod
+    def test_generic_derivations_override(ut_class, bip_class, bip_coins, test_seed_bytes):
+        class BipOverride(bip_class):
+            def Coin(self):
+                return self._CoinGeneric(self)
+
+            def Account(self, acc_idx):
+                return self._AccountGeneric(self, acc_idx)
+
+            def Change(self, change_type):
+                return self._ChangeGeneric(self, change_type)
+
+            def AddressIndex(self, addr_idx):
+                return self._AddressIndexGeneric(self, addr_idx)
+
+        seed_bytes = binascii.unhexlify(test_seed_bytes)
+        bip_obj_ctx = bip_class.FromSeed(seed_bytes, bip_coins.BITCOIN).Purpose()
+        bip_obj_ovr_ctx = BipOverride.FromSeed(seed_bytes, bip_coins.BITCOIN).Purpose()
+
+        bip_obj_ctx = bip_obj_ctx.Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(1)
+        bip_obj_ovr_ctx = bip_obj_ovr_ctx.Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(1)
+
+        ut_class.assertTrue(isinstance(bip_obj_ovr_ctx, BipOverride))
+        ut_class.assertEqual(bip_obj_ctx.PrivateKey().ToExtended(), bip_obj_ovr_ctx.PrivateKey().ToExtended())
+
+    # Test address computation, both before and after getting the public key
+    @staticmethod
+    def test_address(ut_class, bip_class, test_vector):
+        for test in test_vector:
+            bip_obj_ctx = bip_class.FromSeed(binascii.unhexlify(test["seed"]), test["coin"])
+            bip_obj_ctx = bip_obj_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT)
+
+            for idx, test_addr in enumerate(test["addresses"]):
+                bip_obj_addr_ctx = bip_obj_ctx.AddressIndex(idx)
+
+                if test["coin"] in (Bip44Coins.MONERO_ED25519_SLIP, Bip44Coins.MONERO_SECP256K1):
+                    ut_class.assertRaises(ValueError, bip_obj_addr_ctx.Address)
+                    bip_obj_addr_ctx.PublicKey()
+                    ut_class.assertRaises(ValueError, bip_obj_addr_ctx.Address)
+                else:
+                    # Address before public key
+                    ut_class.assertEqual(test_addr, bip_obj_addr_ctx.Address())
+                    ut_class.assertEqual(test_addr, bip_obj_addr_ctx.PublicKey().ToAddress())
+                    # Address after public key
+                    bip_obj_addr_ctx = bip_obj_ctx.AddressIndex(idx)
+                    ut_class.assertEqual(test_addr, bip_obj_addr_ctx.PublicKey().ToAddress())
+                    ut_class.assertEqual(test_addr, bip_obj_addr_ctx.Address())
+
+    # Test weak references to objects
+    @staticmethod
+    def test_weak_ref(ut_class, bip_class, bip_coins, test_seed_bytes):
+        bip_obj_ctx = bip_class.FromSeed(binascii.unhexlify(test_seed_bytes), bip_coins.BITCOIN)
+        bip_obj_ref = weakref.ref(bip_obj_ctx)
+        ut_class.assertIs(bip_obj_ctx, bip_obj_ref())
+
+        del bip_obj_ctx
+        ut_class.assertIsNone(bip_obj_ref())
+
     # Test different key formats
     @staticmethod
     def test_key_formats(ut_class, bip_class, test_data):
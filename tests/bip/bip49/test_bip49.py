@@ -721,6 +721,22 @@ class Bip49Tests(unittest.TestCase):
     def test_is_level(self):
         Bip44BaseTestHelper.test_is_level(self, Bip49, Bip49Coins, TEST_SEED)
 
+    # Test address computation
+    def test_address(self):
+        Bip44BaseTestHelper.test_address(self, Bip49, TEST_VECT)
+
+    # Test weak references
+    def test_weak_ref(self):
+        Bip44BaseTestHelper.test_weak_ref(self, Bip49, Bip49Coins, TEST_SEED)
+
+    # Test address index range derivation
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip49, (Bip49Coins.BITCOIN,), TEST_SEED)
+
+    # Test child classes overriding derivation methods
+    def test_generic_derivations_override(self):
+        Bip44BaseTestHelper.test_generic_derivations_override(self, Bip49, Bip49Coins, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         Bip44BaseTestHelper.test_key_formats(self, Bip49, TEST_VECT_KEY_FORMATS)
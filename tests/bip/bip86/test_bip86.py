@@ -150,6 +150,22 @@ class Bip86Tests(unittest.TestCase):
     def test_is_level(self):
         Bip44BaseTestHelper.test_is_level(self, Bip86, Bip86Coins, TEST_SEED)
 
+    # Test address computation
+    def test_address(self):
+        Bip44BaseTestHelper.test_address(self, Bip86, TEST_VECT)
+
+    # Test weak references
+    def test_weak_ref(self):
+        Bip44BaseTestHelper.test_weak_ref(self, Bip86, Bip86Coins, TEST_SEED)
+
+    # Test address index range derivation
+    def test_address_index_range(self):
+        Bip44BaseTestHelper.test_address_index_range(self, Bip86, (Bip86Coins.BITCOIN,), TEST_SEED)
+
+    # Test child classes overriding derivation methods
+    def test_generic_derivations_override(self):
+        Bip44BaseTestHelper.test_generic_derivations_override(self, Bip86, Bip86Coins, TEST_SEED)
+
     # Test different key formats
     def test_key_formats(self):
         Bip44BaseTestHelper.test_key_formats(self, Bip86, TEST_VECT_KEY_FORMATS)